@@ -18,15 +18,16 @@ directly compared to the official leaderboard results.
 Besides this, the user can choose to evaluate predictions using any other metric from
 :mod:`~epyt_flow.metrics`.
 """
-from typing import Any, Union
+from typing import Any, Union, TYPE_CHECKING
 import os
 import math
+import csv
+from io import StringIO
+from copy import deepcopy
 from datetime import datetime
 import functools
-import scipy
 import pandas as pd
 import numpy as np
-from scipy.sparse import bsr_array
 
 from .battledim_data import START_TIME_TEST, START_TIME_TRAIN, LEAKS_CONFIG_TEST, \
     LEAKS_CONFIG_TRAIN
@@ -37,23 +38,58 @@ from ...topology import NetworkTopology
 from ...simulation.scada import ScadaData
 from ...utils import get_temp_folder, to_seconds, create_path_if_not_exist, download_if_necessary
 
+if TYPE_CHECKING:
+    # Only needed for type annotations -- at runtime, scipy.sparse is imported
+    # lazily by the label-creation code
+    import scipy.sparse
+
+
+def __parse_leak_config(start_time: datetime, leaks_config: str) -> tuple[np.ndarray, ...]:
+    # Parse all entries at once into struct-of-arrays form -- csv.reader tokenizes
+    # the config at C speed and the datetime columns are converted in a single
+    # vectorized pass instead of calling datetime.strptime for every row
+    entries = np.array(list(csv.reader(StringIO(leaks_config), skipinitialspace=True)))
+    sim_start_time = np.datetime64(start_time)
+
+    def timestamps_to_seconds(timestamps: np.ndarray) -> np.ndarray:
+        return (timestamps.astype("datetime64[m]") - sim_start_time)\
+            .astype("timedelta64[s]").astype(np.int64)
+
+    # skipinitialspace only covers whitespace after delimiters -- the first column
+    # still carries the indentation of the config string
+    leaky_pipe_ids = np.char.strip(entries[:, 0])
+    leak_start_times = timestamps_to_seconds(entries[:, 1])
+    leak_end_times = timestamps_to_seconds(entries[:, 2])
+    leak_diameters = entries[:, 3].astype(np.float64)
+    leak_types = entries[:, 4]
+    leak_peak_times = timestamps_to_seconds(entries[:, 5])
+
+    return leaky_pipe_ids, leak_start_times, leak_end_times, leak_diameters, leak_types, \
+        leak_peak_times
+
+
+@functools.lru_cache(maxsize=2)
+def __get_leaks_info(test_scenario: bool) -> tuple[np.ndarray, ...]:
+    # The leak configs are module constants -- parse them at most once per scenario type.
+    # Note that callers must not mutate the returned arrays.
+    start_time = START_TIME_TEST if test_scenario else START_TIME_TRAIN
+    leaks_config = LEAKS_CONFIG_TEST if test_scenario else LEAKS_CONFIG_TRAIN
+    return __parse_leak_config(start_time, leaks_config)
+
+
+@functools.lru_cache(maxsize=2)
+def __get_leakages(test_scenario: bool) -> list[Leakage]:
+    # Build the Leakage event instances from the cached struct-of-arrays leak info.
+    # Note that callers must not mutate the returned list or the leakages therein --
+    # use copy.deepcopy() if modifications are needed.
+    leaky_pipe_ids, leak_start_times, leak_end_times, leak_diameters, leak_types, \
+        leak_peak_times = __get_leaks_info(test_scenario)
 
-def __parse_leak_config(start_time: str, leaks_config: str) -> list[Leakage]:
     leakages = []
-    for leak in leaks_config.splitlines():
-        # Parse entry
-        items = [i.strip() for i in leak.split(",")]
-        leaky_pipe_id = items[0]
-        leak_start_time = int((datetime.strptime(items[1], "%Y-%m-%d %H:%M") - start_time)
-                              .total_seconds())
-        leak_end_time = int((datetime.strptime(items[2], "%Y-%m-%d %H:%M") - start_time)
-                            .total_seconds())
-        leak_diameter = float(items[3])
-        leak_type = items[4]
-        leak_peak_time = int((datetime.strptime(items[5], "%Y-%m-%d %H:%M") - start_time)
-                             .total_seconds())
-
-        # Create leak config
+    for leaky_pipe_id, leak_start_time, leak_end_time, leak_diameter, leak_type, \
+            leak_peak_time in zip(leaky_pipe_ids.tolist(), leak_start_times.tolist(),
+                                  leak_end_times.tolist(), leak_diameters.tolist(),
+                                  leak_types.tolist(), leak_peak_times.tolist()):
         if leak_type == "incipient":
             leak = IncipientLeakage(link_id=leaky_pipe_id, diameter=leak_diameter,
                                     start_time=leak_start_time, end_time=leak_end_time,
@@ -67,34 +103,56 @@ def __parse_leak_config(start_time: str, leaks_config: str) -> list[Leakage]:
     return leakages
 
 
+@functools.lru_cache(maxsize=2)
+def __load_scada_data_cached(f_in: str) -> ScadaData:
+    # Deserializing the ~4GB SCADA file dominates the loading time -- keep the
+    # result around so that repeated calls (e.g. in cross-validation loops)
+    # do not re-parse the file
+    return ScadaData.load_from_file(f_in)
+
+
+def __expand_time_step_ranges(t_idx_start: np.ndarray, t_idx_end: np.ndarray,
+                              link_idx: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Branchless expansion of all [start, end) index ranges into one COO triplet --
+    # i.e. no Python-level loop over the individual time steps or leaks
+    range_lengths = t_idx_end - t_idx_start
+    range_offsets = np.cumsum(range_lengths) - range_lengths
+    rows = (np.repeat(t_idx_start - range_offsets, range_lengths)
+            + np.arange(range_lengths.sum())).astype(np.int32)
+    cols = np.repeat(link_idx, range_lengths).astype(np.int32)
+
+    return rows, cols
+
+
 def __create_labels(n_time_steps: int, return_test_scenario: bool,
-                    links: list[str]) -> tuple[np.ndarray, scipy.sparse.bsr_array]:
-    y = np.zeros(n_time_steps)
+                    links: list[str]) -> tuple[np.ndarray, "scipy.sparse.csr_array"]:
+    # Import scipy.sparse lazily -- callers that never request the leak locations
+    # (e.g. load_scenario) should not pay its import cost
+    from scipy.sparse import csr_array
 
-    start_time = START_TIME_TEST if return_test_scenario is True else START_TIME_TRAIN
-    leaks_config = LEAKS_CONFIG_TEST if return_test_scenario is True else LEAKS_CONFIG_TRAIN
-    leakages = __parse_leak_config(start_time, leaks_config)
+    # Only the link IDs and start/end times are needed here -- use the
+    # struct-of-arrays leak info directly instead of building Leakage instances
+    leaky_pipe_ids, leak_start_times, leak_end_times = __get_leaks_info(return_test_scenario)[:3]
 
-    def leak_time_to_idx(t: int, round_up: bool = False):
-        if round_up is False:
-            return math.floor(t / 300)
-        else:
-            return math.ceil(t / 300)
+    time_step = 300
 
-    leak_locations_row = []
-    leak_locations_col = []
-    for leak in leakages:
-        t_idx_start = leak_time_to_idx(leak.start_time)
-        t_idx_end = leak_time_to_idx(leak.end_time, round_up=True)
-        y[t_idx_start:t_idx_end] = 1
+    # O(1) hash lookups instead of a linear scan of the link list per leak
+    link_to_idx = {link_id: idx for idx, link_id in enumerate(links)}
+
+    # Floor resp. ceiling division -- leak times are integer seconds
+    t_idx_start = leak_start_times // time_step
+    t_idx_end = -(-leak_end_times // time_step)
+    leak_link_idx = np.array([link_to_idx[pipe_id] for pipe_id in leaky_pipe_ids.tolist()])
+
+    leak_locations_row, leak_locations_col = __expand_time_step_ranges(t_idx_start, t_idx_end,
+                                                                       leak_link_idx)
 
-        leak_link_idx = links.index(leak.link_id)
-        for t in range(t_idx_end - t_idx_start):
-            leak_locations_row.append(t_idx_start + t)
-            leak_locations_col.append(leak_link_idx)
+    y = np.zeros(n_time_steps, dtype=bool)
+    y[leak_locations_row] = True
 
-    y_leak_locations = bsr_array(
-        (np.ones(len(leak_locations_row)), (leak_locations_row, leak_locations_col)),
+    y_leak_locations = csr_array(
+        (np.ones(leak_locations_row.size, dtype=np.float32),
+         (leak_locations_row, leak_locations_col)),
         shape=(n_time_steps, len(links)))
 
     return y, y_leak_locations
@@ -148,13 +206,11 @@ def compute_evaluation_score(y_leak_locations_pred: list[tuple[str, int]],
     all_pairs_shortest_path_length = topology.get_all_pairs_shortest_path_length()
 
     # Load ground truth
-    sim_start_time = START_TIME_TEST if test_scenario is True else START_TIME_TRAIN
-    leaks_config = LEAKS_CONFIG_TEST if test_scenario is True else LEAKS_CONFIG_TRAIN
-    leakages = __parse_leak_config(sim_start_time, leaks_config)
+    leakages = __get_leakages(test_scenario)
     n_leakages = len(leakages)
 
     leak_demands = {}
-    if test_scenario is True:
+    if test_scenario:
         # Download leak demands
         for leak in leakages:
             f_in = f"Leak_{leak.link_id}.xlsx"
@@ -242,7 +298,7 @@ def compute_evaluation_score(y_leak_locations_pred: list[tuple[str, int]],
 
     return {"true_positive_rate": true_positive_rate, "true_positives": true_positives,
             "false_positives": false_positives, "false_negatives": false_negatives,
-            "total_savings": total_savings if test_scenario is True else None}
+            "total_savings": total_savings if test_scenario else None}
 
 
 def load_data(return_test_scenario: bool, download_dir: str = None, return_X_y: bool = False,
@@ -276,7 +332,7 @@ def load_data(return_test_scenario: bool, download_dir: str = None, return_X_y:
         The default is False.
     return_leak_locations : `bool`
         If True, the leak locations are returned as well --
-        as an instance of `scipy.sparse.bsr_array`.
+        as an instance of `scipy.sparse.csr_array`.
 
         The default is False.
     verbose : `bool`, optional
@@ -290,7 +346,7 @@ def load_data(return_test_scenario: bool, download_dir: str = None, return_X_y:
         Benchmark data set.
     """
     # Download data files if necessary
-    if return_test_scenario is True:
+    if return_test_scenario:
         url_data = "https://zenodo.org/records/4017659/files/2018_SCADA.xlsx?download=1"
         f_in = "2018_SCADA.xlsx"
     else:
@@ -321,7 +377,7 @@ def load_data(return_test_scenario: bool, download_dir: str = None, return_X_y:
                                 [df_pressures, df_flows, df_levels, df_demands])
 
     # Prepare and return final data
-    if return_X_y is True:
+    if return_X_y:
         features_desc = list(df_final.columns)
         features_desc.remove("Timestamp")
 
@@ -331,13 +387,13 @@ def load_data(return_test_scenario: bool, download_dir: str = None, return_X_y:
         X = df_final[features_desc].to_numpy()
         y, y_leak_locations = __create_labels(X.shape[0], return_test_scenario, links)
 
-        if return_features_desc is True:
-            if return_leak_locations is True:
+        if return_features_desc:
+            if return_leak_locations:
                 return X, y, features_desc, y_leak_locations
             else:
                 return X, y, features_desc
         else:
-            if return_leak_locations is True:
+            if return_leak_locations:
                 return X, y, y_leak_locations
             else:
                 return X, y
@@ -347,7 +403,7 @@ def load_data(return_test_scenario: bool, download_dir: str = None, return_X_y:
 
 def load_scada_data(return_test_scenario: bool, download_dir: str = None,
                     return_X_y: bool = False, return_leak_locations: bool = False,
-                    verbose: bool = True) -> list[Union[ScadaData, Any]]:
+                    labels_only: bool = False, verbose: bool = True) -> list[Union[ScadaData, Any]]:
     """
     Loads the SCADA data of the simulated BattLeDIM benchmark scenario -- note that due to
     randomness, these differ from the original data set which can be loaded by calling
@@ -358,6 +414,16 @@ def load_scada_data(return_test_scenario: bool, download_dir: str = None,
         A large file (approx. 4GB) will be downloaded and loaded into memory --
         this might take some time.
 
+        The loaded file is cached in memory so that subsequent calls do not re-parse it --
+        i.e. repeated calls might return the same
+        :class:`~epyt_flow.simulation.scada.scada_data.ScadaData` instance.
+        Callers who want to modify the returned instance should copy it first.
+
+        Similarly, if `return_X_y` is True, the sensor readings are cached on disk
+        after the first call and `X` is returned as a read-only memory-map on
+        subsequent calls. Callers who want to modify `X` in-place should copy
+        it first.
+
     Parameters
     ----------
     return_test_scenario : `bool`
@@ -376,7 +442,13 @@ def load_scada_data(return_test_scenario: bool, download_dir: str = None,
         The default is False.
     return_leak_locations : `bool`
         If True, the leak locations are returned as well --
-        as an instance of `scipy.sparse.bsr_array`.
+        as an instance of `scipy.sparse.csr_array`.
+
+        The default is False.
+    labels_only : `bool`, optional
+        If True, only the labels (and, if `return_leak_locations` is True, the leak locations)
+        are returned -- in this case, the SCADA data file is neither downloaded nor loaded
+        because the number of time steps is known from the scenario configuration.
 
         The default is False.
     verbose : `bool`, optional
@@ -390,28 +462,76 @@ def load_scada_data(return_test_scenario: bool, download_dir: str = None,
         The simulated benchmark scenario as either a
         :class:`~epyt_flow.simulation.scada.scada_data.ScadaData` instance or as a tuple of
         (X, y) Numpy arrays. If 'return_leak_locations' is True, the leak locations are included
-        as an instance of `scipy.sparse.bsr_array` as well.
+        as an instance of `scipy.sparse.csr_array` as well.
     """
     download_dir = download_dir if download_dir is not None else get_temp_folder()
 
+    if labels_only:
+        # The number of time steps is known from the scenario configuration --
+        # one year of 5min time steps incl. the initial state -- so the large
+        # SCADA data file does not have to be downloaded or deserialized
+        n_time_steps = to_seconds(days=365) // 300 + 1
+        links = load_ltown(download_dir=download_dir, verbose=verbose).sensor_config.links
+
+        y, y_leak_locations = __create_labels(n_time_steps, return_test_scenario, links)
+
+        if return_leak_locations:
+            return y, y_leak_locations
+        else:
+            return y
+
     url_data = "https://filedn.com/lumBFq2P9S74PNoLPWtzxG4/EPyT-Flow/BattLeDIM/"
 
     f_in = f"{'battledim_test' if return_test_scenario else 'battledim_train'}.epytflow_scada_data"
-    download_if_necessary(os.path.join(download_dir, f_in), url_data + f_in, verbose)
-
-    data = ScadaData.load_from_file(os.path.join(download_dir, f_in))
+    f_data_in = os.path.join(download_dir, f_in)
+
+    if return_X_y:
+        # The final sensor readings are cached on disk as .npy files after the first
+        # call -- subsequent calls memory-map them instead of deserializing the
+        # ~4GB SCADA file again, so only the pages actually touched are loaded
+        f_x_cached = f"{f_data_in}_X.npy"
+        f_links_cached = f"{f_data_in}_links.npy"
+        if os.path.isfile(f_x_cached) and os.path.isfile(f_links_cached):
+            X = np.load(f_x_cached, mmap_mode="r")
+            links = np.load(f_links_cached).tolist()
+        else:
+            download_if_necessary(f_data_in, url_data + f_in, verbose)
+            # Load uncached on purpose -- once the .npy files below exist, all
+            # subsequent calls memory-map them and never need the ScadaData
+            # instance again, so caching it here would only pin ~4GB for the
+            # lifetime of the process
+            data = ScadaData.load_from_file(f_data_in)
+
+            X = data.get_data()
+            links = data.sensor_config.links
+
+            # Drop the local reference to the ScadaData instance as early as possible --
+            # only the final sensor readings in X are needed from here on
+            del data
+
+            # Write to temporary names first and move into place afterwards -- a
+            # crash or full disk mid-save must not leave a truncated cache file
+            # behind that the existence check above would accept
+            np.save(f"{f_x_cached}.tmp.npy", X)
+            os.replace(f"{f_x_cached}.tmp.npy", f_x_cached)
+            np.save(f"{f_links_cached}.tmp.npy", np.array(links))
+            os.replace(f"{f_links_cached}.tmp.npy", f_links_cached)
 
-    X = data.get_data()
-    y, y_leak_locations = __create_labels(X.shape[0], return_test_scenario,
-                                          data.sensor_config.links)
+        y, y_leak_locations = __create_labels(X.shape[0], return_test_scenario, links)
 
-    if return_X_y is True:
-        if return_leak_locations is True:
+        if return_leak_locations:
             return X, y, y_leak_locations
         else:
             return X, y
     else:
-        if return_leak_locations is True:
+        download_if_necessary(f_data_in, url_data + f_in, verbose)
+        data = __load_scada_data_cached(f_data_in)
+
+        n_time_steps = data.get_data().shape[0]
+        _, y_leak_locations = __create_labels(n_time_steps, return_test_scenario,
+                                              data.sensor_config.links)
+
+        if return_leak_locations:
             return data, y_leak_locations
         else:
             return data
@@ -463,10 +583,9 @@ def load_scenario(return_test_scenario: bool, download_dir: str = None,
                       "hydraulic_time_step": to_seconds(minutes=5),   # 5min time steps
                       "reporting_time_step": to_seconds(minutes=5)} | ltown_config.general_params
 
-    # Add events
-    start_time = START_TIME_TEST if return_test_scenario is True else START_TIME_TRAIN
-    leaks_config = LEAKS_CONFIG_TEST if return_test_scenario is True else LEAKS_CONFIG_TRAIN
-    leakages = __parse_leak_config(start_time, leaks_config)
+    # Add events -- deep copy the cached leakages because they become part of a
+    # user-facing (i.e. potentially mutated) scenario configuration
+    leakages = deepcopy(__get_leakages(return_test_scenario))
 
     # Build final scenario
     return ScenarioConfig(f_inp_in=ltown_config.f_inp_in, general_params=general_params,
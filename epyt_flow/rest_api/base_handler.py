@@ -3,8 +3,22 @@ This module provides a base handler with some useful methods for all REST API ha
 """
 from typing import Any
 import falcon
+import falcon.media
 
-from ..serialization import my_load_from_json, my_to_json
+from ..serialization import my_load_from_json, my_to_json_bytes
+
+
+class JsonSerializationMediaHandler(falcon.media.BaseHandler):
+    """
+    Falcon media handler wiring the package's own JSON (de)serialization
+    (incl. support for '__type__'-tagged objects) into `req.get_media()` --
+    registering it once on the app replaces per-handler parsing wrappers.
+    """
+    def deserialize(self, stream, content_type: str, content_length: int) -> Any:
+        return my_load_from_json(stream.read())
+
+    def serialize(self, media: Any, content_type: str) -> bytes:
+        return my_to_json_bytes(media)
 
 
 class BaseHandler():
@@ -49,25 +63,38 @@ class BaseHandler():
         resp.status = falcon.HTTP_BAD_REQUEST
         resp.data = "Failed to parse JSON".encode()
 
-    def load_json_data_from_request(self, req: falcon.Request) -> Any:
+    def load_json_data_from_request(self, req: falcon.Request, expected_type: type = None) -> Any:
         """
-        Loads/Parses an object from given JSON data.
+        Loads/Parses an object from given JSON data -- the parsing itself is done by
+        the app's media handler
+        (:class:`~epyt_flow.rest_api.base_handler.JsonSerializationMediaHandler`).
 
         Parameters
         ----------
         req : `falcon.Request`
             Request instance.
+        expected_type : `type`, optional
+            Expected type of the loaded object -- if set, parsing and schema validation
+            are merged into a single call and None is returned when the loaded object
+            is not an instance of this type.
+
+            The default is None.
 
         Returns
         -------
         `Any`
-            Loaded object.
+            Loaded object -- None in the case of a parsing or validation error.
         """
         try:
-            return my_load_from_json(req.bounded_stream.read())
+            data = req.get_media()
         except Exception:
             return None
 
+        if expected_type is not None and not isinstance(data, expected_type):
+            return None
+
+        return data
+
     def send_json_response(self, resp: falcon.Response, data: Any) -> None:
         """
         Sends a JSON response.
@@ -81,4 +108,4 @@ class BaseHandler():
         """
         resp.content_type = falcon.MEDIA_JSON
         resp.status = falcon.HTTP_200
-        resp.data = my_to_json(data).encode()
+        resp.data = my_to_json_bytes(data)
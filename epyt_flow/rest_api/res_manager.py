@@ -2,6 +2,7 @@
 This module contains a class for managing recourses such as scenarios or SCADA data.
 """
 from typing import Any
+import itertools
 import uuid
 
 
@@ -12,8 +13,14 @@ class ResourceManager():
     def __init__(self):
         self.__resources = {}
 
+        # IDs are minted sequentially (per-process random prefix + counter) instead of
+        # as random UUIDs -- consecutive IDs are short, cheap to hash, and keep freshly
+        # inserted entries clustered in the resources dictionary
+        self.__id_prefix = uuid.uuid4().hex[:8]
+        self.__id_counter = itertools.count()
+
     def __create_uuid(self) -> str:
-        return str(uuid.uuid4())
+        return f"{self.__id_prefix}-{next(self.__id_counter)}"
 
     def validate_uuid(self, item_uuid: str) -> bool:
         """
@@ -31,6 +38,26 @@ class ResourceManager():
         """
         return item_uuid in self.__resources
 
+    def try_get(self, item_uuid: str) -> Any:
+        """
+        Gets the item associated with a given UUID -- returns None if the UUID is unknown.
+
+        In contrast to calling :func:`~epyt_flow.rest_api.res_manager.ResourceManager.validate_uuid`
+        followed by :func:`~epyt_flow.rest_api.res_manager.ResourceManager.get`, only a single
+        dictionary lookup is performed.
+
+        Parameters
+        ----------
+        item_uuid : `str`
+            UUID of the item.
+
+        Returns
+        -------
+        `Any`
+            Resource item, or None if no item is associated with the given UUID.
+        """
+        return self.__resources.get(item_uuid)
+
     def create_new_item(self, item: Any) -> str:
         """
         Adds a new item to the resource manager.
@@ -93,3 +120,10 @@ class ResourceManager():
 
         self.close_item(self.__resources[item_uuid])
         del self.__resources[item_uuid]
+
+    def close_all(self) -> None:
+        """
+        Removes (i.e. closes) all items -- e.g. when the resource manager shuts down.
+        """
+        for item_uuid in list(self.__resources):
+            self.remove(item_uuid)
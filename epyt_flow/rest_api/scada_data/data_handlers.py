@@ -2,19 +2,34 @@
 This module provides REST API handlers for accessing the final sensor readings
 (e.g. pressure, flow rate, etc.).
 """
-import warnings
+from operator import methodcaller
+import logging
 import falcon
 
-from .handlers import ScadaDataBaseHandler
+from .handlers import ScadaDataBaseHandler, ScadaDataManager
 
 
-class ScadaDataPressuresHandler(ScadaDataBaseHandler):
+logger = logging.getLogger(__name__)
+
+
+class ScadaDataAttrGetHandler(ScadaDataBaseHandler):
     """
-    Class for handling GET requests for the pressure sensor readings of a given SCADA data instance.
+    Generic handler for GET requests that read a single type of sensor readings of a
+    given SCADA data instance -- sub-classes only specify `data_getter` instead of
+    repeating the same `on_get` body.
     """
+    data_getter = None
+
+    def __init__(self, scada_data_mgr: ScadaDataManager):
+        # Copy the class-level getter into the instance dict at construction time --
+        # the per-request lookup then hits the instance dict instead of walking the MRO
+        self.data_getter = type(self).data_getter
+
+        super().__init__(scada_data_mgr)
+
     def on_get(self, _, resp: falcon.Response, data_id: str) -> None:
         """
-        Gets the pressure sensor readings of a given SCADA data instance.
+        Gets the sensor readings (specified by `data_getter`) of a given SCADA data instance.
 
         Parameters
         ----------
@@ -24,294 +39,97 @@ class ScadaDataPressuresHandler(ScadaDataBaseHandler):
             UUID of the SCADA data.
         """
         try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scada_data = self.get_scada_data_or_error(resp, data_id)
+            if my_scada_data is None:
                 return
 
-            data_pressures = self.scada_data_mgr.get(data_id).get_data_pressures().tolist()
-            self.send_json_response(resp, data_pressures)
+            self.send_json_response(resp, self.data_getter(my_scada_data).tolist())
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
 
-class ScadaDataFlowsHandler(ScadaDataBaseHandler):
+class ScadaDataPressuresHandler(ScadaDataAttrGetHandler):
     """
-    Class for handling GET requests for the flow sensor readings of a given SCADA data instance.
+    Class for handling GET requests for the pressure sensor readings of a given SCADA data instance.
     """
-    def on_get(self, _, resp: falcon.Response, data_id: str) -> None:
-        """
-        Gets the flow sensor readings of a given SCADA data instance.
+    data_getter = methodcaller("get_data_pressures")
 
-        Parameters
-        ----------
-        resp : `falcon.Response`
-            Response instance.
-        data_id : `str`
-            UUID of the SCADA data.
-        """
-        try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
-                return
 
-            data_flows = self.scada_data_mgr.get(data_id).get_data_flows().tolist()
-            self.send_json_response(resp, data_flows)
-        except Exception as ex:
-            warnings.warn(str(ex))
-            resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
+class ScadaDataFlowsHandler(ScadaDataAttrGetHandler):
+    """
+    Class for handling GET requests for the flow sensor readings of a given SCADA data instance.
+    """
+    data_getter = methodcaller("get_data_flows")
 
 
-class ScadaDataDemandsHandler(ScadaDataBaseHandler):
+class ScadaDataDemandsHandler(ScadaDataAttrGetHandler):
     """
     Class for handling GET requests for the demand sensor readings of a given SCADA data instance.
     """
-    def on_get(self, _, resp: falcon.Response, data_id: str) -> None:
-        """
-        Gets the demand sensor readings of a given SCADA data instance.
-
-        Parameters
-        ----------
-        resp : `falcon.Response`
-            Response instance.
-        data_id : `str`
-            UUID of the SCADA data.
-        """
-        try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
-                return
+    data_getter = methodcaller("get_data_demands")
 
-            data_demands = self.scada_data_mgr.get(data_id).get_data_demands().tolist()
-            self.send_json_response(resp, data_demands)
-        except Exception as ex:
-            warnings.warn(str(ex))
-            resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
-
-class ScadaDataValveStatesHandler(ScadaDataBaseHandler):
+class ScadaDataValveStatesHandler(ScadaDataAttrGetHandler):
     """
     Class for handling GET requests for the valve state sensor readings
     of a given SCADA data instance.
     """
-    def on_get(self, _, resp: falcon.Response, data_id: str) -> None:
-        """
-        Gets the valve state sensor readings of a given SCADA data instance.
-
-        Parameters
-        ----------
-        resp : `falcon.Response`
-            Response instance.
-        data_id : `str`
-            UUID of the SCADA data.
-        """
-        try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
-                return
+    data_getter = methodcaller("get_data_valves_state")
 
-            data_demands = self.scada_data_mgr.get(data_id).get_data_valves_state().tolist()
-            self.send_json_response(resp, data_demands)
-        except Exception as ex:
-            warnings.warn(str(ex))
-            resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
-
-class ScadaDataPumpStatesHandler(ScadaDataBaseHandler):
+class ScadaDataPumpStatesHandler(ScadaDataAttrGetHandler):
     """
     Class for handling GET requests for the pump state sensor readings
     of a given SCADA data instance.
     """
-    def on_get(self, _, resp: falcon.Response, data_id: str) -> None:
-        """
-        Gets the pump state sensor readings of a given SCADA data instance.
-
-        Parameters
-        ----------
-        resp : `falcon.Response`
-            Response instance.
-        data_id : `str`
-            UUID of the SCADA data.
-        """
-        try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
-                return
+    data_getter = methodcaller("get_data_pumps_state")
 
-            data_demands = self.scada_data_mgr.get(data_id).get_data_pumps_state().tolist()
-            self.send_json_response(resp, data_demands)
-        except Exception as ex:
-            warnings.warn(str(ex))
-            resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
-
-class ScadaDataTankVolumesHandler(ScadaDataBaseHandler):
+class ScadaDataTankVolumesHandler(ScadaDataAttrGetHandler):
     """
     Class for handling GET requests for the tank volume sensor readings
     of a given SCADA data instance.
     """
-    def on_get(self, _, resp: falcon.Response, data_id: str) -> None:
-        """
-        Gets the tank volume sensor readings of a given SCADA data instance.
+    data_getter = methodcaller("get_data_tanks_water_volume")
 
-        Parameters
-        ----------
-        resp : `falcon.Response`
-            Response instance.
-        data_id : `str`
-            UUID of the SCADA data.
-        """
-        try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
-                return
 
-            data_demands = self.scada_data_mgr.get(data_id).get_data_tanks_water_volume().tolist()
-            self.send_json_response(resp, data_demands)
-        except Exception as ex:
-            warnings.warn(str(ex))
-            resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
-
-
-class ScadaDataNodesQualityHandler(ScadaDataBaseHandler):
+class ScadaDataNodesQualityHandler(ScadaDataAttrGetHandler):
     """
     Class for handling GET requests for the node quality sensor readings
     of a given SCADA data instance.
     """
-    def on_get(self, _, resp: falcon.Response, data_id: str) -> None:
-        """
-        Gets the node quality sensor readings of a given SCADA data instance.
-
-        Parameters
-        ----------
-        resp : `falcon.Response`
-            Response instance.
-        data_id : `str`
-            UUID of the SCADA data.
-        """
-        try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
-                return
+    data_getter = methodcaller("get_data_nodes_quality")
 
-            data_nodes_quality = self.scada_data_mgr.get(data_id).get_data_nodes_quality().tolist()
-            self.send_json_response(resp, data_nodes_quality)
-        except Exception as ex:
-            warnings.warn(str(ex))
-            resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
-
-class ScadaDataLinksQualityHandler(ScadaDataBaseHandler):
+class ScadaDataLinksQualityHandler(ScadaDataAttrGetHandler):
     """
     Class for handling GET requests for the link quality sensor readings
     of a given SCADA data instance.
     """
-    def on_get(self, _, resp: falcon.Response, data_id: str) -> None:
-        """
-        Gets the link/pipe quality sensor readings of a given SCADA data instance.
-
-        Parameters
-        ----------
-        resp : `falcon.Response`
-            Response instance.
-        data_id : `str`
-            UUID of the SCADA data.
-        """
-        try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
-                return
+    data_getter = methodcaller("get_data_links_quality")
 
-            data_links_quality = self.scada_data_mgr.get(data_id).get_data_links_quality().tolist()
-            self.send_json_response(resp, data_links_quality)
-        except Exception as ex:
-            warnings.warn(str(ex))
-            resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
-
-class ScadaDataNodeBulkSpeciesHandler(ScadaDataBaseHandler):
+class ScadaDataNodeBulkSpeciesHandler(ScadaDataAttrGetHandler):
     """
     Class for handling GET requests for the bulk species node concentration sensor readings
     of a given SCADA data instance.
     """
-    def on_get(self, _, resp: falcon.Response, data_id: str) -> None:
-        """
-        Gets the bulk species node concentrations sensor readings of a given SCADA data instance.
+    data_getter = methodcaller("get_data_bulk_species_node_concentration")
 
-        Parameters
-        ----------
-        resp : `falcon.Response`
-            Response instance.
-        data_id : `str`
-            UUID of the SCADA data.
-        """
-        try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
-                return
 
-            data_conc = self.scada_data_mgr.get(data_id).\
-                get_data_bulk_species_node_concentration().tolist()
-            self.send_json_response(resp, data_conc)
-        except Exception as ex:
-            warnings.warn(str(ex))
-            resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
-
-
-class ScadaDataLinkBulkSpeciesHandler(ScadaDataBaseHandler):
+class ScadaDataLinkBulkSpeciesHandler(ScadaDataAttrGetHandler):
     """
     Class for handling GET requests for the bulk species link/pipe concentration sensor readings
     of a given SCADA data instance.
     """
-    def on_get(self, _, resp: falcon.Response, data_id: str) -> None:
-        """
-        Gets the bulk species link/pipe concentrations sensor readings of a
-        given SCADA data instance.
+    data_getter = methodcaller("get_data_bulk_species_link_concentration")
 
-        Parameters
-        ----------
-        resp : `falcon.Response`
-            Response instance.
-        data_id : `str`
-            UUID of the SCADA data.
-        """
-        try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
-                return
 
-            data_conc = self.scada_data_mgr.get(data_id).\
-                get_data_bulk_species_link_concentration().tolist()
-            self.send_json_response(resp, data_conc)
-        except Exception as ex:
-            warnings.warn(str(ex))
-            resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
-
-
-class ScadaDataSurfaceSpeciesHandler(ScadaDataBaseHandler):
+class ScadaDataSurfaceSpeciesHandler(ScadaDataAttrGetHandler):
     """
     Class for handling GET requests for the surface species concentration sensor readings
     of a given SCADA data instance.
     """
-    def on_get(self, _, resp: falcon.Response, data_id: str) -> None:
-        """
-        Gets the surface species concentrations sensor readings of a given SCADA data instance.
-
-        Parameters
-        ----------
-        resp : `falcon.Response`
-            Response instance.
-        data_id : `str`
-            UUID of the SCADA data.
-        """
-        try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
-                return
-
-            data_links_quality = self.scada_data_mgr.get(data_id).\
-                get_data_surface_species_concentration().tolist()
-            self.send_json_response(resp, data_links_quality)
-        except Exception as ex:
-            warnings.warn(str(ex))
-            resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
+    data_getter = methodcaller("get_data_surface_species_concentration")
@@ -3,7 +3,7 @@ This module provides REST API handlers for exporting a given SCADA data instance
 """
 import os
 from abc import abstractmethod
-import warnings
+import logging
 import falcon
 
 from .handlers import ScadaDataBaseHandler
@@ -12,6 +12,9 @@ from ...simulation.scada import ScadaData, ScadaDataNumpyExport, ScadaDataMatlab
     ScadaDataXlsxExport
 
 
+logger = logging.getLogger(__name__)
+
+
 class ScadaDataBaseExportHandler(ScadaDataBaseHandler):
     """
     Base handler for exporting a given SCADA data instance.
@@ -77,12 +80,10 @@ class ScadaDataBaseExportHandler(ScadaDataBaseHandler):
             UUID of the SCADA data.
         """
         try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scada_data = self.get_scada_data_or_error(resp, data_id)
+            if my_scada_data is None:
                 return
 
-            my_scada_data = self.scada_data_mgr.get(data_id)
-
             tmp_file = self.create_temp_file_path(data_id, self.__file_ext)
             self.export(my_scada_data, tmp_file)
 
@@ -90,7 +91,8 @@ class ScadaDataBaseExportHandler(ScadaDataBaseHandler):
 
             os.remove(tmp_file)
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
 
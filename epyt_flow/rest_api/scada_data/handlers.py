@@ -1,7 +1,8 @@
 """
 The module provides REST API handlers for some SCADA data requests.
 """
-import warnings
+from typing import Any
+import logging
 import falcon
 
 from ..base_handler import BaseHandler
@@ -9,6 +10,9 @@ from ..res_manager import ResourceManager
 from ...simulation import SensorConfig, SensorFault
 
 
+logger = logging.getLogger(__name__)
+
+
 class ScadaDataManager(ResourceManager):
     """
     Class for managing SCADA data.
@@ -27,6 +31,29 @@ class ScadaDataBaseHandler(BaseHandler):
     def __init__(self, scada_data_mgr: ScadaDataManager):
         self.scada_data_mgr = scada_data_mgr
 
+    def get_scada_data_or_error(self, resp: falcon.Response, data_id: str) -> Any:
+        """
+        Gets the SCADA data instance associated with a given UUID -- sends an
+        invalid-resource-ID error and returns None if the UUID is unknown.
+
+        Parameters
+        ----------
+        resp : `falcon.Response`
+            Response instance.
+        data_id : `str`
+            UUID of the SCADA data.
+
+        Returns
+        -------
+        :class:`~epyt_flow.simulation.scada.scada_data.ScadaData`
+            SCADA data instance, or None if no instance is associated with the given UUID.
+        """
+        my_scada_data = self.scada_data_mgr.try_get(data_id)
+        if my_scada_data is None:
+            self.send_invalid_resource_id_error(resp)
+
+        return my_scada_data
+
 
 class ScadaDataRemoveHandler(ScadaDataBaseHandler):
     """
@@ -44,13 +71,13 @@ class ScadaDataRemoveHandler(ScadaDataBaseHandler):
             UUID of the SCADA data instance.
         """
         try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            if self.get_scada_data_or_error(resp, data_id) is None:
                 return
 
             self.scada_data_mgr.remove(data_id)
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
 
@@ -71,14 +98,15 @@ class ScadaDataSensorConfigHandler(ScadaDataBaseHandler):
             UUID of the SCADA data.
         """
         try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scada_data = self.get_scada_data_or_error(resp, data_id)
+            if my_scada_data is None:
                 return
 
-            my_sensor_config = self.scada_data_mgr.get(data_id).sensor_config
+            my_sensor_config = my_scada_data.sensor_config
             self.send_json_response(resp, my_sensor_config)
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
     def on_post(self, req: falcon.Request, resp: falcon.Response, data_id: str) -> None:
@@ -95,18 +123,19 @@ class ScadaDataSensorConfigHandler(ScadaDataBaseHandler):
             UUID of the SCADA data.
         """
         try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scada_data = self.get_scada_data_or_error(resp, data_id)
+            if my_scada_data is None:
                 return
 
-            sensor_config = self.load_json_data_from_request(req)
-            if not isinstance(sensor_config, SensorConfig):
+            sensor_config = self.load_json_data_from_request(req, expected_type=SensorConfig)
+            if sensor_config is None:
                 self.send_json_parsing_error(resp)
                 return
 
-            self.scada_data_mgr.get(data_id).sensor_config = sensor_config
+            my_scada_data.sensor_config = sensor_config
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
 
@@ -127,14 +156,15 @@ class ScadaDataSensorFaultsHandler(ScadaDataBaseHandler):
             UUID of the SCADA data.
         """
         try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scada_data = self.get_scada_data_or_error(resp, data_id)
+            if my_scada_data is None:
                 return
 
-            sensor_faults = self.scada_data_mgr.get(data_id).sensor_faults
+            sensor_faults = my_scada_data.sensor_faults
             self.send_json_response(resp, sensor_faults)
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
     def on_post(self, req: falcon.Request, resp: falcon.Response, data_id: str) -> None:
@@ -151,19 +181,20 @@ class ScadaDataSensorFaultsHandler(ScadaDataBaseHandler):
             UUID of the SCADA data.
         """
         try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scada_data = self.get_scada_data_or_error(resp, data_id)
+            if my_scada_data is None:
                 return
 
-            sensor_faults = self.load_json_data_from_request(req)
-            if not isinstance(sensor_faults, list) or \
+            sensor_faults = self.load_json_data_from_request(req, expected_type=list)
+            if sensor_faults is None or \
                     any(not isinstance(e, SensorFault) for e in sensor_faults):
                 self.send_json_parsing_error(resp)
                 return
 
-            self.scada_data_mgr.get(data_id).sensor_faults = sensor_faults
+            my_scada_data.sensor_faults = sensor_faults
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
 
@@ -186,16 +217,15 @@ class ScadaDataConvertUnitsHandler(ScadaDataBaseHandler):
             UUID of the SCADA data.
         """
         try:
-            if self.scada_data_mgr.validate_uuid(data_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scada_data = self.get_scada_data_or_error(resp, data_id)
+            if my_scada_data is None:
                 return
 
-            new_units = self.load_json_data_from_request(req)
-            if not isinstance(new_units, dict):
+            new_units = self.load_json_data_from_request(req, expected_type=dict)
+            if new_units is None:
                 self.send_json_parsing_error(resp)
                 return
 
-            my_scada_data = self.scada_data_mgr.get(data_id)
             try:
                 scada_data_new = my_scada_data.convert_units(**new_units)
             except Exception as ex:
@@ -205,5 +235,6 @@ class ScadaDataConvertUnitsHandler(ScadaDataBaseHandler):
             new_scada_data_id = self.scada_data_mgr.create_new_item(scada_data_new)
             self.send_json_response(resp, {"data_id": new_scada_data_id})
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
@@ -1,38 +1,22 @@
 """
 This module provides REST API handlers for scenario events.
 """
-import warnings
+import logging
+from operator import attrgetter
 import falcon
 
-from .handlers import ScenarioBaseHandler
+from .handlers import ScenarioAttrGetHandler
 from ...simulation import Leakage, SensorFault
 
 
-class ScenarioLeakageHandler(ScenarioBaseHandler):
+logger = logging.getLogger(__name__)
+
+
+class ScenarioLeakageHandler(ScenarioAttrGetHandler):
     """
     Class for handling GET and POST requests concerning leakages.
     """
-    def on_get(self, _, resp: falcon.Response, scenario_id: str) -> None:
-        """
-        Gets all leakages of a given scenario.
-
-        Parameters
-        ----------
-        resp : `falcon.Response`
-            Response instance.
-        scenario_id : `str`
-            UUID of the scenario.
-        """
-        try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
-                return
-
-            my_leakages = self.scenario_mgr.get(scenario_id).leakages
-            self.send_json_response(resp, my_leakages)
-        except Exception as ex:
-            warnings.warn(str(ex))
-            resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
+    attr_getter = attrgetter("leakages")
 
     def on_post(self, req: falcon.Request, resp: falcon.Response, scenario_id: str) -> None:
         """
@@ -48,46 +32,29 @@ class ScenarioLeakageHandler(ScenarioBaseHandler):
             UUID of the scenario.
         """
         try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scenario = self.get_scenario_or_error(resp, scenario_id)
+            if my_scenario is None:
                 return
 
-            leakage = self.load_json_data_from_request(req)
-            if not isinstance(leakage, Leakage):
+            leakage = self.load_json_data_from_request(req, expected_type=Leakage)
+            if leakage is None:
                 self.send_json_parsing_error(resp)
                 return
 
-            self.scenario_mgr.get(scenario_id).add_leakage(leakage)
+            with self.scenario_mgr.get_lock(scenario_id):
+                my_scenario.add_leakage(leakage)
+                self.scenario_mgr.bump_version(scenario_id)
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
 
-class ScenarioSensorFaultHandler(ScenarioBaseHandler):
+class ScenarioSensorFaultHandler(ScenarioAttrGetHandler):
     """
     Class for handling GET and POST requests concerning sensor faults.
     """
-    def on_get(self, _, resp: falcon.Response, scenario_id: str) -> None:
-        """
-        Gets all sensor faults of a given scenario.
-
-        Parameters
-        ----------
-        resp : `falcon.Response`
-            Response instance.
-        scenario_id : `str`
-            UUID of the scenario.
-        """
-        try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
-                return
-
-            my_sensor_faults = self.scenario_mgr.get(scenario_id).sensor_faults
-            self.send_json_response(resp, my_sensor_faults)
-        except Exception as ex:
-            warnings.warn(str(ex))
-            resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
+    attr_getter = attrgetter("sensor_faults")
 
     def on_post(self, req: falcon.Request, resp: falcon.Response, scenario_id: str) -> None:
         """
@@ -103,16 +70,19 @@ class ScenarioSensorFaultHandler(ScenarioBaseHandler):
             UUID of the scenario.
         """
         try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scenario = self.get_scenario_or_error(resp, scenario_id)
+            if my_scenario is None:
                 return
 
-            sensor_fault = self.load_json_data_from_request(req)
-            if not isinstance(sensor_fault, SensorFault):
+            sensor_fault = self.load_json_data_from_request(req, expected_type=SensorFault)
+            if sensor_fault is None:
                 self.send_json_parsing_error(resp)
                 return
 
-            self.scenario_mgr.get(scenario_id).add_sensor_fault(sensor_fault)
+            with self.scenario_mgr.get_lock(scenario_id):
+                my_scenario.add_sensor_fault(sensor_fault)
+                self.scenario_mgr.bump_version(scenario_id)
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
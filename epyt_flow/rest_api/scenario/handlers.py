@@ -1,20 +1,54 @@
 """
 This module provides REST API handlers for some requests concerning scenarios.
 """
-import warnings
+from typing import Any, Callable
+from operator import attrgetter
+from io import BytesIO
+import threading
+import zipfile
+import logging
 import os
 import falcon
 
 from ..base_handler import BaseHandler
 from ..res_manager import ResourceManager
-from ...utils import get_temp_folder, pack_zip_archive
-from ...simulation import ScenarioSimulator, SensorConfig
+from ...serialization import my_to_json_bytes
+from ...utils import get_temp_folder
+from ...simulation import ScenarioSimulator, SensorConfig, Leakage, SensorFault, SensorNoise, \
+    ModelUncertainty
+
+
+logger = logging.getLogger(__name__)
 
 
 class ScenarioManager(ResourceManager):
     """
     Class for managing all scenarios that are currently used by the REST API.
     """
+    def __init__(self):
+        super().__init__()
+
+        self.__versions = {}
+        self.__json_cache = {}
+        self.__locks = {}
+
+        # Pool of warm (i.e. already initialized but never mutated) simulators keyed by
+        # the creation arguments -- re-creating a scenario from the same .inp file can
+        # then skip opening EPANET and parsing the file again. The pool is a list of
+        # (key, simulator) tuples in parking order, bounded per key and globally
+        self.__warm_pool = []
+        self.__warm_pool_cap = 2
+        self.__warm_pool_total_cap = 8
+        self.__creation_keys = {}
+
+    def __get_warm_pool_key(self, kwds: dict) -> tuple:
+        try:
+            key = tuple(sorted(kwds.items()))
+            hash(key)
+            return key
+        except TypeError:   # un-hashable arguments (e.g. a scenario config) are not pooled
+            return None
+
     def create(self, **kwds) -> str:
         """
         Creates a new scenario -- e.g. loading a given .inp file or
@@ -25,11 +59,150 @@ class ScenarioManager(ResourceManager):
         `str`
             UUID of the new scenario.
         """
-        return self.create_new_item(ScenarioSimulator(**kwds))
+        key = self.__get_warm_pool_key(kwds)
+
+        my_scenario = None
+        if key is not None:
+            for idx, (parked_key, parked_scenario) in enumerate(self.__warm_pool):
+                if parked_key == key:
+                    my_scenario = parked_scenario
+                    del self.__warm_pool[idx]
+                    break
+        if my_scenario is None:
+            my_scenario = ScenarioSimulator(**kwds)
+
+        scenario_id = self.create_new_item(my_scenario)
+        self.__versions[scenario_id] = 0
+        self.__locks[scenario_id] = threading.RLock()
+        if key is not None:
+            self.__creation_keys[scenario_id] = key
+
+        return scenario_id
+
+    def get_lock(self, scenario_id: str) -> threading.RLock:
+        """
+        Gets the lock of a given scenario -- all mutations of a scenario must be applied
+        while holding its lock, so that concurrent POST requests to the same scenario
+        do not race.
+
+        Parameters
+        ----------
+        scenario_id : `str`
+            UUID of the scenario.
+
+        Returns
+        -------
+        `threading.RLock`
+            Lock of the scenario.
+        """
+        return self.__locks.setdefault(scenario_id, threading.RLock())
+
+    def get_version(self, scenario_id: str) -> int:
+        """
+        Gets the version of a given scenario -- i.e. a counter that is incremented
+        whenever the scenario is mutated.
+
+        Parameters
+        ----------
+        scenario_id : `str`
+            UUID of the scenario.
+
+        Returns
+        -------
+        `int`
+            Version of the scenario.
+        """
+        return self.__versions.get(scenario_id, 0)
+
+    def bump_version(self, scenario_id: str) -> None:
+        """
+        Increments the version of a given scenario -- i.e. invalidates all
+        cached responses of this scenario.
+
+        Parameters
+        ----------
+        scenario_id : `str`
+            UUID of the scenario.
+        """
+        self.__versions[scenario_id] = self.__versions.get(scenario_id, 0) + 1
+
+    def get_cached_json(self, scenario_id: str, kind: str) -> bytes:
+        """
+        Gets the cached (already JSON-encoded) response of a given scenario --
+        None, if no response is cached for the current version of the scenario.
+
+        Parameters
+        ----------
+        scenario_id : `str`
+            UUID of the scenario.
+        kind : `str`
+            Type of the cached response -- e.g. "topology".
+
+        Returns
+        -------
+        `bytes`
+            Cached JSON response or None.
+        """
+        entry = self.__json_cache.get((scenario_id, kind))
+        if entry is not None and entry[0] == self.get_version(scenario_id):
+            return entry[1]
+
+        return None
+
+    def set_cached_json(self, scenario_id: str, kind: str, data: bytes) -> None:
+        """
+        Caches a JSON-encoded response for the current version of a given scenario.
+
+        Parameters
+        ----------
+        scenario_id : `str`
+            UUID of the scenario.
+        kind : `str`
+            Type of the cached response -- e.g. "topology".
+        data : `bytes`
+            JSON-encoded response.
+        """
+        self.__json_cache[(scenario_id, kind)] = (self.get_version(scenario_id), data)
+
+    def remove(self, item_uuid: str) -> None:
+        # Simulators that were never mutated (version 0) are still in their
+        # freshly-loaded state and can be parked for the next create() with the
+        # same arguments instead of being closed
+        key = self.__creation_keys.pop(item_uuid, None)
+        if key is not None and self.get_version(item_uuid) == 0:
+            n_parked = sum(1 for parked_key, _ in self.__warm_pool if parked_key == key)
+            if n_parked < self.__warm_pool_cap:
+                self.__warm_pool.append((key, self.try_get(item_uuid)))
+
+                # The pool is also bounded across all keys -- otherwise, a long-running
+                # server that sees many distinct creation arguments would accumulate
+                # live EPANET instances forever
+                if len(self.__warm_pool) > self.__warm_pool_total_cap:
+                    _, evicted_scenario = self.__warm_pool.pop(0)
+                    evicted_scenario.close()
+
+        super().remove(item_uuid)
+
+        self.__versions.pop(item_uuid, None)
+        self.__locks.pop(item_uuid, None)
+        for key in [key for key in self.__json_cache if key[0] == item_uuid]:
+            del self.__json_cache[key]
 
     def close_item(self, item: ScenarioSimulator) -> None:
+        if any(parked_scenario is item for _, parked_scenario in self.__warm_pool):
+            return
+
         item.close()
 
+    def close_all(self) -> None:
+        super().close_all()
+
+        # Removing the items above may have parked some simulators -- on shutdown,
+        # the parked ones must be closed as well
+        while self.__warm_pool:
+            _, parked_scenario = self.__warm_pool.pop()
+            parked_scenario.close()
+
 
 class ScenarioBaseHandler(BaseHandler):
     """
@@ -43,6 +216,141 @@ class ScenarioBaseHandler(BaseHandler):
     def __init__(self, scenario_mgr: ScenarioManager):
         self.scenario_mgr = scenario_mgr
 
+    def get_scenario_or_error(self, resp: falcon.Response,
+                              scenario_id: str) -> ScenarioSimulator:
+        """
+        Gets the scenario associated with a given UUID -- sends an
+        invalid-resource-ID error and returns None if the UUID is unknown.
+
+        Parameters
+        ----------
+        resp : `falcon.Response`
+            Response instance.
+        scenario_id : `str`
+            UUID of the scenario.
+
+        Returns
+        -------
+        :class:`~epyt_flow.simulation.scenario_simulator.ScenarioSimulator`
+            Scenario, or None if no scenario is associated with the given UUID.
+        """
+        my_scenario = self.scenario_mgr.try_get(scenario_id)
+        if my_scenario is None:
+            self.send_invalid_resource_id_error(resp)
+
+        return my_scenario
+
+    def send_not_modified_if_etag_matches(self, req: falcon.Request, resp: falcon.Response,
+                                          scenario_id: str, kind: str) -> bool:
+        """
+        Implements conditional GET requests: Sets the ETag header (derived from the
+        scenario's version counter) and, if the request's If-None-Match header already
+        carries the current ETag, answers with "304 Not Modified".
+
+        Parameters
+        ----------
+        req : `falcon.Request`
+            Request instance.
+        resp : `falcon.Response`
+            Response instance.
+        scenario_id : `str`
+            UUID of the scenario.
+        kind : `str`
+            Type of the response -- e.g. "topology".
+
+        Returns
+        -------
+        `bool`
+            True if "304 Not Modified" was sent -- i.e. no response body is needed.
+        """
+        etag = f'W/"{scenario_id}.{self.scenario_mgr.get_version(scenario_id)}.{kind}"'
+        resp.set_header("ETag", etag)
+
+        if req.get_header("If-None-Match") == etag:
+            resp.status = falcon.HTTP_304
+            return True
+
+        return False
+
+    def send_cached_json_response(self, req: falcon.Request, resp: falcon.Response,
+                                  scenario_id: str, kind: str,
+                                  produce_data: Callable[[], Any]) -> None:
+        """
+        Sends a JSON response that is cached per scenario -- i.e. `produce_data` and the
+        JSON serialization are only run if no response is cached for the current version
+        of the scenario. Polling clients that already hold the current version are
+        answered with "304 Not Modified" without any serialization work.
+
+        Parameters
+        ----------
+        req : `falcon.Request`
+            Request instance.
+        resp : `falcon.Response`
+            Response instance.
+        scenario_id : `str`
+            UUID of the scenario.
+        kind : `str`
+            Type of the response -- e.g. "topology".
+        produce_data : `Callable[[], Any]`
+            Callable computing the data to be sent.
+        """
+        if self.send_not_modified_if_etag_matches(req, resp, scenario_id, kind):
+            return
+
+        data = self.scenario_mgr.get_cached_json(scenario_id, kind)
+        if data is None:
+            data = my_to_json_bytes(produce_data())
+            self.scenario_mgr.set_cached_json(scenario_id, kind, data)
+
+        resp.content_type = falcon.MEDIA_JSON
+        resp.status = falcon.HTTP_200
+        resp.data = data
+
+
+class ScenarioAttrGetHandler(ScenarioBaseHandler):
+    """
+    Generic handler for GET requests that read a single attribute of a given scenario --
+    sub-classes only specify `attr_getter` instead of repeating the same `on_get` body.
+    """
+    attr_getter: Callable[[ScenarioSimulator], Any] = None
+
+    def __init__(self, scenario_mgr: ScenarioManager):
+        # Specialize the hot path at construction time -- copying the class-level
+        # getter into the instance dict and pre-computing the ETag kind avoids an
+        # MRO walk and a type(self).__name__ lookup per request
+        self.attr_getter = type(self).attr_getter
+        self.__etag_kind = type(self).__name__
+
+        super().__init__(scenario_mgr)
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response, scenario_id: str) -> None:
+        """
+        Gets the attribute (specified by `attr_getter`) of a given scenario.
+
+        Parameters
+        ----------
+        req : `falcon.Request`
+            Request instance.
+        resp : `falcon.Response`
+            Response instance.
+        scenario_id : `str`
+            UUID of the scenario.
+        """
+        try:
+            my_scenario = self.get_scenario_or_error(resp, scenario_id)
+            if my_scenario is None:
+                return
+
+            if self.send_not_modified_if_etag_matches(req, resp, scenario_id,
+                                                      self.__etag_kind):
+                return
+
+            self.send_json_response(resp, self.attr_getter(my_scenario))
+        except Exception as ex:
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
+            resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
+
 
 class ScenarioRemoveHandler(ScenarioBaseHandler):
     """
@@ -60,16 +368,42 @@ class ScenarioRemoveHandler(ScenarioBaseHandler):
             UUID of the scenario.
         """
         try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            if self.get_scenario_or_error(resp, scenario_id) is None:
                 return
 
             self.scenario_mgr.remove(scenario_id)
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
 
+class _TempFileStream:
+    """
+    Read-only file stream that deletes the underlying file once the stream is closed --
+    used for sending temporary files on platforms where an open file cannot be
+    unlinked (i.e. Windows).
+
+    Parameters
+    ----------
+    file_in : `str`
+        Path to the temporary file.
+    """
+    def __init__(self, file_in: str):
+        self.__file_in = file_in
+        self.__f = open(file_in, "rb")
+
+    def read(self, size: int = -1) -> bytes:
+        return self.__f.read(size)
+
+    def close(self) -> None:
+        self.__f.close()
+        try:
+            os.remove(self.__file_in)
+        except OSError:   # a file that cannot be removed right now is left to the OS
+            pass
+
+
 class ScenarioExportHandler(ScenarioBaseHandler):
     """
     Class for handling GET requests for exporting a given scenario to EPANET files
@@ -91,7 +425,8 @@ class ScenarioExportHandler(ScenarioBaseHandler):
     def __send_temp_file(self, resp: falcon.Response, tmp_file: str,
                          content_type: str = "application/octet-stream") -> None:
         """
-        Sends a given file (`tmp_file`) to the the client.
+        Sends a given file (`tmp_file`) to the the client -- note that the file is
+        deleted right away.
 
         Parameters
         ----------
@@ -102,8 +437,23 @@ class ScenarioExportHandler(ScenarioBaseHandler):
         """
         resp.status = falcon.HTTP_200
         resp.content_type = content_type
-        with open(tmp_file, 'rb') as f:
-            resp.text = f.read()
+        resp.content_length = os.path.getsize(tmp_file)
+
+        # Hand an open file to Falcon instead of buffering it -- the server streams
+        # (or sendfiles) it chunk-wise and closes it afterwards, so the peak memory
+        # no longer depends on the export size
+        if os.name != "nt":
+            f = open(tmp_file, 'rb')
+
+            # Unlink immediately -- the contents stay readable through the open file
+            # descriptor, which is released once the response stream is closed
+            os.remove(tmp_file)
+
+            resp.stream = f
+        else:
+            # Windows refuses to delete a file while a handle to it is open --
+            # delete it once the response stream has been closed instead
+            resp.stream = _TempFileStream(tmp_file)
 
     def on_get(self, _, resp: falcon.Response, scenario_id: str) -> None:
         """
@@ -117,28 +467,37 @@ class ScenarioExportHandler(ScenarioBaseHandler):
             UUID of the scenario.
         """
         try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scenario = self.get_scenario_or_error(resp, scenario_id)
+            if my_scenario is None:
                 return
 
-            my_scenario = self.scenario_mgr.get(scenario_id)
-
             f_inp_out = self.__create_temp_file_path(scenario_id, "inp")
-            f_msx_out = self.__create_temp_file_path(scenario_id, "msx")
-            my_scenario.save_to_epanet_file(f_inp_out, f_msx_out)
-
-            if os.path.isfile(f_msx_out):
-                f_out = self.__create_temp_file_path(scenario_id, "zip")
-                pack_zip_archive([f_inp_out, f_msx_out], f_out)
 
-                self.__send_temp_file(resp, f_out)
-                os.remove(f_out)
+            # Whether a .msx file will be written is known up-front -- no need to
+            # ask the file system afterwards
+            if my_scenario.f_msx_in is not None:
+                f_msx_out = self.__create_temp_file_path(scenario_id, "msx")
+                my_scenario.save_to_epanet_file(f_inp_out, f_msx_out)
+
+                # EPANET needs real paths for the .inp and .msx files, but the .zip
+                # archive can be built directly in memory -- no third temporary file
+                buf = BytesIO()
+                with zipfile.ZipFile(buf, "w") as f_zip_out:
+                    for f_cur_in in [f_inp_out, f_msx_out]:
+                        f_zip_out.write(f_cur_in, arcname=os.path.basename(f_cur_in),
+                                        compress_type=zipfile.ZIP_DEFLATED)
                 os.remove(f_msx_out)
+                os.remove(f_inp_out)
+
+                resp.status = falcon.HTTP_200
+                resp.content_type = "application/octet-stream"
+                resp.data = buf.getvalue()
             else:
+                my_scenario.save_to_epanet_file(f_inp_out)
                 self.__send_temp_file(resp, f_inp_out)
-            os.remove(f_inp_out)
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
 
@@ -146,26 +505,29 @@ class ScenarioConfigHandler(ScenarioBaseHandler):
     """
     Class for handling a GET request for getting the scenario configuration of a given scenario.
     """
-    def on_get(self, _, resp: falcon.Response, scenario_id: str) -> None:
+    def on_get(self, req: falcon.Request, resp: falcon.Response, scenario_id: str) -> None:
         """
         Gets the scenario configuration of a given scenario.
 
         Parameters
         ----------
+        req : `falcon.Request`
+            Request instance.
         resp : `falcon.Response`
             Response instance.
         scenario_id : `str`
             UUID of the scenario.
         """
         try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scenario = self.get_scenario_or_error(resp, scenario_id)
+            if my_scenario is None:
                 return
 
-            my_sceanrio_config = self.scenario_mgr.get(scenario_id).get_scenario_config()
-            self.send_json_response(resp, my_sceanrio_config)
+            self.send_cached_json_response(req, resp, scenario_id, "scenario_config",
+                                           my_scenario.get_scenario_config)
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
 
@@ -191,7 +553,8 @@ class ScenarioNewHandler(ScenarioBaseHandler):
             scenario_id = self.scenario_mgr.create(**args)
             self.send_json_response(resp, {"scenario_id": scenario_id})
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
 
@@ -199,26 +562,29 @@ class ScenarioTopologyHandler(ScenarioBaseHandler):
     """
     Class for handling GET requests for getting the topology of a given scenario.
     """
-    def on_get(self, _, resp: falcon.Response, scenario_id: str) -> None:
+    def on_get(self, req: falcon.Request, resp: falcon.Response, scenario_id: str) -> None:
         """
         Gets the topology of a given scenario.
 
         Parameters
         ----------
+        req : `falcon.Request`
+            Request instance.
         resp : `falcon.Response`
             Response instance.
         scenario_id : `str`
             UUID of the scenario.
         """
         try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scenario = self.get_scenario_or_error(resp, scenario_id)
+            if my_scenario is None:
                 return
 
-            my_topology = self.scenario_mgr.get(scenario_id).get_topology()
-            self.send_json_response(resp, my_topology)
+            self.send_cached_json_response(req, resp, scenario_id, "topology",
+                                           my_scenario.get_topology)
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
 
@@ -226,27 +592,30 @@ class ScenarioGeneralParamsHandler(ScenarioBaseHandler):
     """
     Class for handling GET and POST requests for the general parameters of a given scenario.
     """
-    def on_get(self, _, resp: falcon.Response, scenario_id: str) -> None:
+    def on_get(self, req: falcon.Request, resp: falcon.Response, scenario_id: str) -> None:
         """
         Gets the general parameters (e.g. simulation duration, etc.) of a given scenario.
 
         Parameters
         ----------
+        req : `falcon.Request`
+            Request instance.
         resp : `falcon.Response`
             Response instance.
         scenario_id : `str`
             UUID of the scenario.
         """
         try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scenario = self.get_scenario_or_error(resp, scenario_id)
+            if my_scenario is None:
                 return
 
-            my_general_params = self.scenario_mgr.get(scenario_id).get_scenario_config().\
-                general_params
-            self.send_json_response(resp, my_general_params)
+            self.send_cached_json_response(
+                req, resp, scenario_id, "general_params",
+                lambda: my_scenario.get_scenario_config().general_params)
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
     def on_post(self, req: falcon.Request, resp: falcon.Response, scenario_id: str) -> None:
@@ -263,74 +632,149 @@ class ScenarioGeneralParamsHandler(ScenarioBaseHandler):
             UUID of the scenario.
         """
         try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scenario = self.get_scenario_or_error(resp, scenario_id)
+            if my_scenario is None:
                 return
 
-            general_params = self.load_json_data_from_request(req)
-            if not isinstance(general_params, dict):
+            general_params = self.load_json_data_from_request(req, expected_type=dict)
+            if general_params is None:
                 self.send_json_parsing_error(resp)
                 return
 
-            self.scenario_mgr.get(scenario_id).set_general_parameters(**general_params)
+            with self.scenario_mgr.get_lock(scenario_id):
+                my_scenario.set_general_parameters(**general_params)
+                self.scenario_mgr.bump_version(scenario_id)
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
 
-class ScenarioSensorConfigHandler(ScenarioBaseHandler):
+class ScenarioSensorConfigHandler(ScenarioAttrGetHandler):
     """
     Class for handling GET and POST requests for the sensor configuration of a given scenario.
     """
-    def on_get(self, _, resp: falcon.Response, scenario_id: str) -> None:
+    attr_getter = attrgetter("sensor_config")
+
+    def on_post(self, req: falcon.Request, resp: falcon.Response, scenario_id: str) -> None:
         """
-        Gets the sensor configuration of a given scenario.
+        Sets the sensor configuration of a given scenario.
 
         Parameters
         ----------
-        resp : `falcon.Response`
-            Response instance.
+        req : `falcon.Request`
+            Request instance.
+        resp : `falcon.Request`
+            Request instance.
         scenario_id : `str`
             UUID of the scenario.
         """
         try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scenario = self.get_scenario_or_error(resp, scenario_id)
+            if my_scenario is None:
+                return
+
+            sensor_config = self.load_json_data_from_request(req, expected_type=SensorConfig)
+            if sensor_config is None:
+                self.send_json_parsing_error(resp)
                 return
 
-            my_sensor_config = self.scenario_mgr.get(scenario_id).sensor_config
-            self.send_json_response(resp, my_sensor_config)
+            with self.scenario_mgr.get_lock(scenario_id):
+                my_scenario.sensor_config = sensor_config
+                self.scenario_mgr.bump_version(scenario_id)
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
+
+class ScenarioBatchHandler(ScenarioBaseHandler):
+    """
+    Class for handling POST requests that apply a batch of mutations to a given scenario --
+    i.e. many mutations can be applied with a single request instead of one request per mutation.
+    """
+    def __apply_operation(self, my_scenario: ScenarioSimulator, operation: str,
+                          payload: Any) -> None:
+        """
+        Applies a single mutation to a given scenario.
+
+        Parameters
+        ----------
+        my_scenario : :class:`~epyt_flow.simulation.scenario_simulator.ScenarioSimulator`
+            Scenario to be mutated.
+        operation : `str`
+            Name of the operation -- must be one of "add_leakage", "add_sensor_fault",
+            "set_model_uncertainty", "set_sensor_noise", "set_node_demand_pattern".
+        payload : `Any`
+            Payload of the operation -- e.g. the leakage to be added.
+        """
+        if operation == "add_leakage":
+            if not isinstance(payload, Leakage):
+                raise ValueError("Payload must be an instance of 'Leakage'")
+            my_scenario.add_leakage(payload)
+        elif operation == "add_sensor_fault":
+            if not isinstance(payload, SensorFault):
+                raise ValueError("Payload must be an instance of 'SensorFault'")
+            my_scenario.add_sensor_fault(payload)
+        elif operation == "set_model_uncertainty":
+            if not isinstance(payload, ModelUncertainty):
+                raise ValueError("Payload must be an instance of 'ModelUncertainty'")
+            my_scenario.model_uncertainty = payload
+        elif operation == "set_sensor_noise":
+            if not isinstance(payload, SensorNoise):
+                raise ValueError("Payload must be an instance of 'SensorNoise'")
+            my_scenario.sensor_noise = payload
+        elif operation == "set_node_demand_pattern":
+            my_scenario.set_node_demand_pattern(payload["node_id"], payload["base_demand"],
+                                                payload["demand_pattern_id"],
+                                                payload["demand_pattern"])
+        else:
+            raise ValueError(f"Unknown operation '{operation}'")
+
     def on_post(self, req: falcon.Request, resp: falcon.Response, scenario_id: str) -> None:
         """
-        Sets the sensor configuration of a given scenario.
+        Applies a batch of mutations to a given scenario.
+
+        The request body must be a list of items of the form
+        {"op": <operation name>, "payload": <operation payload>} -- the items are applied
+        in the given order, and a list of per-item results
+        {"ok": <bool>, "error": <error message or None>} is returned.
 
         Parameters
         ----------
         req : `falcon.Request`
             Request instance.
-        resp : `falcon.Request`
-            Request instance.
+        resp : `falcon.Response`
+            Response instance.
         scenario_id : `str`
             UUID of the scenario.
         """
         try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scenario = self.get_scenario_or_error(resp, scenario_id)
+            if my_scenario is None:
                 return
 
-            sensor_config = self.load_json_data_from_request(req)
-            if not isinstance(sensor_config, SensorConfig):
+            items = self.load_json_data_from_request(req, expected_type=list)
+            if items is None:
                 self.send_json_parsing_error(resp)
                 return
 
-            my_scenario = self.scenario_mgr.get(scenario_id)
-            my_scenario.sensor_config = sensor_config
+            results = []
+            with self.scenario_mgr.get_lock(scenario_id):
+                for item in items:
+                    try:
+                        self.__apply_operation(my_scenario, item["op"], item["payload"])
+                        results.append({"ok": True, "error": None})
+                    except Exception as ex:
+                        results.append({"ok": False, "error": str(ex)})
+
+                if any(result["ok"] for result in results):
+                    self.scenario_mgr.bump_version(scenario_id)
+
+            self.send_json_response(resp, results)
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
 
@@ -355,17 +799,19 @@ class ScenarioNodeDemandPatternHandler(ScenarioBaseHandler):
             ID of the node.
         """
         try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scenario = self.get_scenario_or_error(resp, scenario_id)
+            if my_scenario is None:
                 return
 
             params = self.load_json_data_from_request(req)
 
-            my_scenario = self.scenario_mgr.get(scenario_id)
-            my_scenario.set_node_demand_pattern(node_id, params["base_demand"],
-                                                params["demand_pattern_id"],
-                                                params["demand_pattern"])
+            with self.scenario_mgr.get_lock(scenario_id):
+                my_scenario.set_node_demand_pattern(node_id, params["base_demand"],
+                                                    params["demand_pattern_id"],
+                                                    params["demand_pattern"])
+                self.scenario_mgr.bump_version(scenario_id)
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.data = str(ex)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
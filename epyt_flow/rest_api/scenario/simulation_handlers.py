@@ -1,16 +1,79 @@
 """
 This module provides REST API handlers concerning the simulation of scenarios.
 """
-import warnings
+import os
+import uuid
+import logging
+from multiprocessing import shared_memory, resource_tracker
 import falcon
+from multiprocess import Pool, cpu_count
 
 from .handlers import ScenarioBaseHandler
 from ..scada_data.handlers import ScadaDataManager
+from ...simulation import ScenarioSimulator, ScenarioConfig
+from ...simulation.scada import ScadaData
+from ...utils import get_temp_folder
 
 
-class ScenarioSimulationHandler(ScenarioBaseHandler):
+logger = logging.getLogger(__name__)
+
+
+def _create_untracked_shared_memory(size: int) -> shared_memory.SharedMemory:
+    # The parent process unlinks the block after loading the result, so the block
+    # must not be owned by the worker's resource tracker -- Python 3.13+ offers
+    # 'track=False' for exactly this; on older versions, the registration made at
+    # creation time (under the slash-prefixed POSIX name) is reverted instead
+    try:
+        return shared_memory.SharedMemory(create=True, size=size, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        if os.name != "nt":
+            resource_tracker.unregister(f"/{shm.name}", "shared_memory")
+
+        return shm
+
+
+def _run_simulation(scenario_config: ScenarioConfig, sim_function: str,
+                    params: dict) -> tuple[str, int]:
+    with ScenarioSimulator(scenario_config=scenario_config) as sim:
+        scada_data = getattr(sim, sim_function)(**params)
+
+    # The result is handed back through shared memory (serialized with the package's
+    # own msgpack format) instead of being pickled through the pool's result pipe --
+    # only the block's name and size cross the pipe
+    data = scada_data.dump()
+    shm = _create_untracked_shared_memory(len(data))
+    shm.buf[:len(data)] = data
+    shm.close()
+
+    return shm.name, len(data)
+
+
+def _load_simulation_result(shm_name: str, size: int) -> ScadaData:
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        return ScadaData.load(bytes(shm.buf[:size]))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+_sim_pool = None
+
+
+def _get_simulation_pool() -> Pool:
+    # The pool of simulation workers is created lazily and shared by all simulation
+    # handlers -- re-used worker processes avoid a process start per simulation
+    global _sim_pool
+    if _sim_pool is None:
+        _sim_pool = Pool(processes=cpu_count())
+
+    return _sim_pool
+
+
+class ScenarioSimulationBaseHandler(ScenarioBaseHandler):
     """
-    Class for handling GET requests for simulating a given scenario.
+    Base class for all simulation handlers.
 
     Parameters
     ----------
@@ -22,6 +85,64 @@ class ScenarioSimulationHandler(ScenarioBaseHandler):
 
         super().__init__(**kwds)
 
+    def run_simulation_in_worker(self, my_scenario: ScenarioSimulator, sim_function: str,
+                                 params: dict) -> ScadaData:
+        """
+        Runs a simulation of a given scenario in a worker process -- i.e. the
+        EPANET run does not block other requests and multiple simulations can
+        utilize multiple CPU cores.
+
+        Parameters
+        ----------
+        my_scenario : :class:`~epyt_flow.simulation.scenario_simulator.ScenarioSimulator`
+            Scenario to be simulated.
+        sim_function : `str`
+            Name of the simulation function to be called -- e.g. "run_simulation".
+        params : `dict`
+            Additional arguments passed to the simulation function.
+
+        Returns
+        -------
+        :class:`~epyt_flow.simulation.scada.scada_data.ScadaData`
+            Simulation results.
+        """
+        # Snapshot the live EPANET model to temporary files -- mutations applied through
+        # the EPANET API (e.g. demand pattern changes) are not part of the original
+        # .inp file and would otherwise be lost when the worker re-builds the simulator
+        f_inp_snapshot = os.path.join(get_temp_folder(), f"{uuid.uuid4().hex}.inp")
+        f_msx_snapshot = None
+        if my_scenario.f_msx_in is not None:
+            f_msx_snapshot = f"{f_inp_snapshot[:-4]}.msx"
+        my_scenario.save_to_epanet_file(f_inp_snapshot, f_msx_snapshot,
+                                        export_sensor_config=False)
+
+        # General parameters are omitted on purpose -- they are already encoded
+        # in the snapshot files
+        scenario_config = my_scenario.get_scenario_config()
+        sensor_reading_events = scenario_config.sensor_reading_events
+        worker_config = ScenarioConfig(f_inp_in=f_inp_snapshot, f_msx_in=f_msx_snapshot,
+                                       sensor_config=scenario_config.sensor_config,
+                                       controls=scenario_config.controls,
+                                       sensor_noise=scenario_config.sensor_noise,
+                                       model_uncertainty=scenario_config.model_uncertainty,
+                                       system_events=scenario_config.system_events,
+                                       sensor_reading_events=sensor_reading_events)
+
+        try:
+            shm_name, size = _get_simulation_pool().apply(_run_simulation,
+                                                          (worker_config, sim_function, params))
+
+            return _load_simulation_result(shm_name, size)
+        finally:
+            os.remove(f_inp_snapshot)
+            if f_msx_snapshot is not None:
+                os.remove(f_msx_snapshot)
+
+
+class ScenarioSimulationHandler(ScenarioSimulationBaseHandler):
+    """
+    Class for handling GET requests for simulating a given scenario.
+    """
     def on_post(self, req: falcon.Request, resp: falcon.Response, scenario_id: str) -> None:
         """
         Runs the simulation of a given scenario.
@@ -41,19 +162,19 @@ class ScenarioSimulationHandler(ScenarioBaseHandler):
             UUID of the scenario.
         """
         try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scenario = self.get_scenario_or_error(resp, scenario_id)
+            if my_scenario is None:
                 return
 
             params = self.load_json_data_from_request(req)
 
-            my_scenario = self.scenario_mgr.get(scenario_id)
-            res = my_scenario.run_simulation(**params)
+            res = self.run_simulation_in_worker(my_scenario, "run_simulation", params)
 
             data_id = self.scada_data_mgr.create_new_item(res)
             self.send_json_response(resp, {"data_id": data_id})
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.data = str(ex)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
@@ -69,35 +190,25 @@ class ScenarioSimulationHandler(ScenarioBaseHandler):
             UUID of the scenario.
         """
         try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scenario = self.get_scenario_or_error(resp, scenario_id)
+            if my_scenario is None:
                 return
 
-            my_scenario = self.scenario_mgr.get(scenario_id)
-            res = my_scenario.run_simulation()
+            res = self.run_simulation_in_worker(my_scenario, "run_simulation", {})
 
             data_id = self.scada_data_mgr.create_new_item(res)
             self.send_json_response(resp, {"data_id": data_id})
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.data = str(ex)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
 
-class ScenarioBasicQualitySimulationHandler(ScenarioBaseHandler):
+class ScenarioBasicQualitySimulationHandler(ScenarioSimulationBaseHandler):
     """
     Class for handling POST requests for runing a basic quality simulation of a given scenario.
-
-    Parameters
-    ----------
-    scada_data_mgr : :class:`~epyt_flow.rest_api.scada_data.handlers.ScadaDataManager`
-        SCADA data manager.
     """
-    def __init__(self, scada_data_mgr: ScadaDataManager, **kwds):
-        self.scada_data_mgr = scada_data_mgr
-
-        super().__init__(**kwds)
-
     def on_post(self, req: falcon.Request, resp: falcon.Response, scenario_id: str) -> None:
         """
         Runs the basic quality simulation of a given scenario.
@@ -112,37 +223,28 @@ class ScenarioBasicQualitySimulationHandler(ScenarioBaseHandler):
             UUID of the scenario.
         """
         try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scenario = self.get_scenario_or_error(resp, scenario_id)
+            if my_scenario is None:
                 return
 
             params = self.load_json_data_from_request(req)
 
-            my_scenario = self.scenario_mgr.get(scenario_id)
-            res = my_scenario.run_basic_quality_simulation(**params)
+            res = self.run_simulation_in_worker(my_scenario, "run_basic_quality_simulation",
+                                                params)
 
             data_id = self.scada_data_mgr.create_new_item(res)
             self.send_json_response(resp, {"data_id": data_id})
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.data = str(ex)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
 
-class ScenarioAdvancedQualitySimulationHandler(ScenarioBaseHandler):
+class ScenarioAdvancedQualitySimulationHandler(ScenarioSimulationBaseHandler):
     """
     Class for handling POST requests for runing an advanced quality simulation of a given scenario.
-
-    Parameters
-    ----------
-    scada_data_mgr : :class:`~epyt_flow.rest_api.scada_data.handlers.ScadaDataManager`
-        SCADA data manager.
     """
-    def __init__(self, scada_data_mgr: ScadaDataManager, **kwds):
-        self.scada_data_mgr = scada_data_mgr
-
-        super().__init__(**kwds)
-
     def on_post(self, req: falcon.Request, resp: falcon.Response, scenario_id: str) -> None:
         """
         Runs the advanced quality simulation of a given scenario.
@@ -157,18 +259,19 @@ class ScenarioAdvancedQualitySimulationHandler(ScenarioBaseHandler):
             UUID of the scenario.
         """
         try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scenario = self.get_scenario_or_error(resp, scenario_id)
+            if my_scenario is None:
                 return
 
             params = self.load_json_data_from_request(req)
 
-            my_scenario = self.scenario_mgr.get(scenario_id)
-            res = my_scenario.run_advanced_quality_simulation(**params)
+            res = self.run_simulation_in_worker(my_scenario, "run_advanced_quality_simulation",
+                                                params)
 
             data_id = self.scada_data_mgr.create_new_item(res)
             self.send_json_response(resp, {"data_id": data_id})
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.data = str(ex)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
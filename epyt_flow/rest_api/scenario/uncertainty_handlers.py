@@ -1,38 +1,22 @@
 """
 This module provides REST API handlers for model and sensor uncertainties of scenarios.
 """
-import warnings
+import logging
+from operator import attrgetter
 import falcon
 
-from .handlers import ScenarioBaseHandler
+from .handlers import ScenarioAttrGetHandler
 from ...simulation import SensorNoise, ModelUncertainty
 
 
-class ScenarioModelUncertaintyHandler(ScenarioBaseHandler):
+logger = logging.getLogger(__name__)
+
+
+class ScenarioModelUncertaintyHandler(ScenarioAttrGetHandler):
     """
     Class for handling GET and POST requests concerning model uncertainty.
     """
-    def on_get(self, _, resp: falcon.Response, scenario_id: str) -> None:
-        """
-        Gets the model uncertainties of a given scenario.
-
-        Parameters
-        ----------
-        resp : `falcon.Response`
-            Response instance.
-        scenario_id : `str`
-            UUID of the scenario.
-        """
-        try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
-                return
-
-            my_model_uncertainties = self.scenario_mgr.get(scenario_id).model_uncertainty
-            self.send_json_response(resp, my_model_uncertainties)
-        except Exception as ex:
-            warnings.warn(str(ex))
-            resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
+    attr_getter = attrgetter("model_uncertainty")
 
     def on_post(self, req: falcon.Request, resp: falcon.Response, scenario_id: str) -> None:
         """
@@ -48,46 +32,30 @@ class ScenarioModelUncertaintyHandler(ScenarioBaseHandler):
             UUID of the scenario.
         """
         try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scenario = self.get_scenario_or_error(resp, scenario_id)
+            if my_scenario is None:
                 return
 
-            model_uncertainty = self.load_json_data_from_request(req)
-            if not isinstance(model_uncertainty, ModelUncertainty):
+            model_uncertainty = self.load_json_data_from_request(
+                req, expected_type=ModelUncertainty)
+            if model_uncertainty is None:
                 self.send_json_parsing_error(resp)
                 return
 
-            self.scenario_mgr.get(scenario_id).model_uncertainty = model_uncertainty
+            with self.scenario_mgr.get_lock(scenario_id):
+                my_scenario.model_uncertainty = model_uncertainty
+                self.scenario_mgr.bump_version(scenario_id)
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
 
 
-class ScenarioSensorUncertaintyHandler(ScenarioBaseHandler):
+class ScenarioSensorUncertaintyHandler(ScenarioAttrGetHandler):
     """
     Class for handling GET and POST requests concerning sensor uncertainty (i.e. noise).
     """
-    def on_get(self, _, resp: falcon.Response, scenario_id: str) -> None:
-        """
-        Gets the sensor uncertainty (i.e. noise) of a given scenario.
-
-        Parameters
-        ----------
-        resp : `falcon.Response`
-            Response instance.
-        scenario_id : `str`
-            UUID of the scenario.
-        """
-        try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
-                return
-
-            my_sensor_noise = self.scenario_mgr.get(scenario_id).sensor_noise
-            self.send_json_response(resp, my_sensor_noise)
-        except Exception as ex:
-            warnings.warn(str(ex))
-            resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
+    attr_getter = attrgetter("sensor_noise")
 
     def on_post(self, req: falcon.Request, resp: falcon.Response, scenario_id: str) -> None:
         """
@@ -103,16 +71,19 @@ class ScenarioSensorUncertaintyHandler(ScenarioBaseHandler):
             UUID of the scenario.
         """
         try:
-            if self.scenario_mgr.validate_uuid(scenario_id) is False:
-                self.send_invalid_resource_id_error(resp)
+            my_scenario = self.get_scenario_or_error(resp, scenario_id)
+            if my_scenario is None:
                 return
 
-            sensor_noise = self.load_json_data_from_request(req)
-            if not isinstance(sensor_noise, SensorNoise):
+            sensor_noise = self.load_json_data_from_request(req, expected_type=SensorNoise)
+            if sensor_noise is None:
                 self.send_json_parsing_error(resp)
                 return
 
-            self.scenario_mgr.get(scenario_id).sensor_noise = sensor_noise
+            with self.scenario_mgr.get_lock(scenario_id):
+                my_scenario.sensor_noise = sensor_noise
+                self.scenario_mgr.bump_version(scenario_id)
         except Exception as ex:
-            warnings.warn(str(ex))
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", ex, exc_info=True)
             resp.status = falcon.HTTP_INTERNAL_SERVER_ERROR
@@ -4,10 +4,11 @@ This module provides the EPyT-Flow REST API server.
 from wsgiref.simple_server import make_server, WSGIServer
 import falcon
 
+from .base_handler import JsonSerializationMediaHandler
 from .scenario.handlers import ScenarioManager, ScenarioNewHandler, \
     ScenarioRemoveHandler, ScenarioGeneralParamsHandler, ScenarioSensorConfigHandler, \
     ScenarioExportHandler, ScenarioTopologyHandler, ScenarioConfigHandler, \
-    ScenarioNodeDemandPatternHandler
+    ScenarioNodeDemandPatternHandler, ScenarioBatchHandler
 from .scenario.uncertainty_handlers import ScenarioModelUncertaintyHandler, \
     ScenarioSensorUncertaintyHandler
 from .scenario.event_handlers import ScenarioLeakageHandler, ScenarioSensorFaultHandler
@@ -37,6 +38,7 @@ class RestApiService():
     """
     def __init__(self, port: int = 8080):
         self.app = falcon.App()
+        self.app.req_options.media_handlers[falcon.MEDIA_JSON] = JsonSerializationMediaHandler()
         self.__port = port
 
         self.scenario_mgr = ScenarioManager()
@@ -66,6 +68,8 @@ class RestApiService():
                            ScenarioSensorFaultHandler(self.scenario_mgr))
         self.app.add_route("/scenario/{scenario_id}/node/{node_id}/demand_pattern",
                            ScenarioNodeDemandPatternHandler(self.scenario_mgr))
+        self.app.add_route("/scenario/{scenario_id}/batch",
+                           ScenarioBatchHandler(self.scenario_mgr))
         self.app.add_route("/scenario/{scenario_id}/simulation",
                            ScenarioSimulationHandler(scenario_mgr=self.scenario_mgr,
                                                      scada_data_mgr=self.scada_data_mgr))
@@ -139,5 +143,9 @@ class RestApiService():
         """
         Runs the REST service.
         """
-        with self.make_server() as httpd:
-            httpd.serve_forever()
+        try:
+            with self.make_server() as httpd:
+                httpd.serve_forever()
+        finally:
+            self.scenario_mgr.close_all()
+            self.scada_data_mgr.close_all()
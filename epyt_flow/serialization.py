@@ -7,6 +7,7 @@ from io import BufferedIOBase
 import importlib
 import json
 import gzip
+import orjson
 import umsgpack
 import numpy as np
 import networkx
@@ -216,9 +217,12 @@ class Serializable(ABC):
         return save_to_file(f_out, self, use_zip)
 
 
-def my_to_json(obj: Any) -> str:
+def my_to_json_bytes(obj: Any) -> bytes:
     """
-    Serializes a given object to JSON.
+    Serializes a given object to (UTF-8 encoded) JSON data.
+
+    Serialization is done by `orjson <https://github.com/ijl/orjson>`_, which encodes in C
+    and serializes numpy arrays without a .tolist() round-trip.
 
     Parameters
     ----------
@@ -227,19 +231,39 @@ def my_to_json(obj: Any) -> str:
 
     Returns
     -------
-    `str`
+    `bytes`
         JSON data.
     """
-    def __json_serialize(obj_: Any) -> dict:
+    def __json_serialize(obj_: Any) -> Any:
         if isinstance(obj_, JsonSerializable):
             my_class_name = (obj_.__module__, obj_.__class__.__name__)
             return obj_.get_attributes() | {"__type__": my_class_name}
         elif isinstance(obj_, np.ndarray):
+            # orjson only handles numeric/bool/datetime arrays itself -- arrays of any
+            # other dtype (e.g. node ID strings) end up here and go through .tolist()
             return obj_.tolist()
         else:
-            return obj_
+            raise TypeError(f"Cannot serialize '{type(obj_)}'")
+
+    return orjson.dumps(obj, default=__json_serialize,
+                        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+def my_to_json(obj: Any) -> str:
+    """
+    Serializes a given object to JSON.
 
-    return json.dumps(obj, default=__json_serialize)
+    Parameters
+    ----------
+    obj : `Any`
+        Object to be serialized.
+
+    Returns
+    -------
+    `str`
+        JSON data.
+    """
+    return my_to_json_bytes(obj).decode()
 
 
 def my_load_from_json(data: str) -> Any:
@@ -255,10 +255,13 @@ class Leakage(SystemEvent, JsonSerializable):
 
             all_nodes_id = self._epanet_api.getNodeNameID()
             if new_node_id in all_nodes_id:
-                raise ValueError(f"There is already a leak at pipe {self.link_id}")
-
-            self._epanet_api.splitPipe(self.link_id, new_link_id, new_node_id)
-            self.__leaky_node_id = self._epanet_api.getNodeIndex(new_node_id)
+                # The network already contains the split pipe and leak node of this
+                # leakage -- e.g. the model was exported after the leak was added and
+                # re-loaded (such as in a simulation worker) -- so re-use them
+                self.__leaky_node_id = self._epanet_api.getNodeIndex(new_node_id)
+            else:
+                self._epanet_api.splitPipe(self.link_id, new_link_id, new_node_id)
+                self.__leaky_node_id = self._epanet_api.getNodeIndex(new_node_id)
         else:
             if self.__node_id not in self._epanet_api.getNodeNameID():
                 raise ValueError(f"Unknown node '{self.__node_id}'")
@@ -707,9 +707,10 @@ class ScenarioSimulator():
         self.__adapt_to_network_changes()
 
         general_params = {"hydraulic_time_step": self.get_hydraulic_time_step(),
+                          "reporting_time_step": self.epanet_api.getTimeReportingStep(),
                           "quality_time_step": self.get_quality_time_step(),
                           "simulation_duration": self.get_simulation_duration(),
-                          "flow_units": self.get_flow_units(),
+                          "flow_units_id": self.get_flow_units(),
                           "quality_model": self.get_quality_model(),
                           "demand_model": self.get_demand_model()}
 
@@ -890,6 +891,10 @@ class ScenarioSimulator():
             raise TypeError("'leakage_event' must be an instance of " +
                             "'epyt_flow.simulation.events.Leakage' not of " +
                             f"'{type(leakage_event)}'")
+        if leakage_event.link_id is not None and \
+                any(isinstance(event, Leakage) and event.link_id == leakage_event.link_id
+                    for event in self.__system_events):
+            raise ValueError(f"There is already a leak at pipe {leakage_event.link_id}")
 
         self.add_system_event(leakage_event)
 
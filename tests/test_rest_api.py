@@ -0,0 +1,95 @@
+"""
+Module provides tests to test the REST API
+(:class:`~epyt_flow.rest_api.server.RestApiService`).
+"""
+import os
+import epyt
+from epyt.epanet import ToolkitConstants
+import falcon.testing
+from epyt_flow.rest_api.server import RestApiService
+from epyt_flow.serialization import my_load_from_json, my_to_json
+from epyt_flow.simulation import AbruptLeakage
+from epyt_flow.utils import to_seconds
+
+
+def get_net1_inp_file() -> str:
+    return os.path.join(os.path.dirname(epyt.__file__), "networks", "asce-tf-wdst", "Net1.inp")
+
+
+def test_rest_api():
+    service = RestApiService(port=8080)
+    client = falcon.testing.TestClient(service.app)
+
+    # Create a new scenario
+    resp = client.simulate_post("/scenario/new",
+                                body=my_to_json({"f_inp_in": get_net1_inp_file()}),
+                                headers={"Content-Type": "application/json"})
+    assert resp.status_code == 200
+    scenario_id = my_load_from_json(resp.content)["scenario_id"]
+
+    try:
+        # Request the topology -- a repeated conditional request must be answered
+        # with 304 Not Modified as long as the scenario is not changed
+        resp = client.simulate_get(f"/scenario/{scenario_id}/topology")
+        assert resp.status_code == 200
+        etag = resp.headers["ETag"]
+
+        resp = client.simulate_get(f"/scenario/{scenario_id}/topology",
+                                   headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+
+        # Set the sensor configuration
+        resp = client.simulate_get(f"/scenario/{scenario_id}/sensor_config")
+        assert resp.status_code == 200
+        sensor_config = my_load_from_json(resp.content)
+        sensor_config.pressure_sensors = ["11", "22"]
+
+        resp = client.simulate_post(f"/scenario/{scenario_id}/sensor_config",
+                                    body=my_to_json(sensor_config),
+                                    headers={"Content-Type": "application/json"})
+        assert resp.status_code == 200
+
+        # Set the flow units -- leakages require EN_CMH or EN_CFS
+        resp = client.simulate_post(f"/scenario/{scenario_id}/general_params",
+                                    body=my_to_json({"flow_units_id":
+                                                     ToolkitConstants.EN_CMH}),
+                                    headers={"Content-Type": "application/json"})
+        assert resp.status_code == 200
+
+        # Apply a batch of mutations -- invalid operations must not abort the batch
+        leak = AbruptLeakage(link_id="12", diameter=0.1,
+                             start_time=to_seconds(hours=2), end_time=to_seconds(hours=10))
+        batch = [{"op": "add_leakage", "payload": leak},
+                 {"op": "no_such_operation", "payload": None}]
+
+        resp = client.simulate_post(f"/scenario/{scenario_id}/batch", body=my_to_json(batch),
+                                    headers={"Content-Type": "application/json"})
+        assert resp.status_code == 200
+        results = my_load_from_json(resp.content)
+        assert results[0]["ok"] is True
+        assert results[1]["ok"] is False
+
+        # The batch changed the scenario -- the cached topology must be re-validated
+        resp = client.simulate_get(f"/scenario/{scenario_id}/topology",
+                                   headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+
+        # Run a simulation and retrieve the sensor readings
+        resp = client.simulate_get(f"/scenario/{scenario_id}/simulation")
+        assert resp.status_code == 200
+        data_id = my_load_from_json(resp.content)["data_id"]
+
+        try:
+            resp = client.simulate_get(f"/scada_data/{data_id}/nodes/pressures")
+            assert resp.status_code == 200
+            pressures = my_load_from_json(resp.content)
+            assert len(pressures) > 0
+            assert len(pressures[0]) == 2
+        finally:
+            client.simulate_delete(f"/scada_data/{data_id}")
+
+        # Invalid resource IDs must be rejected
+        resp = client.simulate_get("/scenario/invalid-id/topology")
+        assert resp.status_code == 400
+    finally:
+        client.simulate_delete(f"/scenario/{scenario_id}")